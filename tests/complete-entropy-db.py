@@ -1,7 +1,7 @@
 import argparse
 import random as rnd
 
-from utils import WORDS, get_feedback, format_feedback
+from utils import WORDS, get_feedback_batch, format_feedback
 from wordle_solver.candidate_scorers import EntropyScorer, OptimisedEntropyScorer, FastEntropyScorer
 from wordle_solver.filter import Filter
 
@@ -27,12 +27,7 @@ def get_patterns(guess: str, answers: list[str]) -> set[int]:
         set[int]: A list of patterns, where each pattern is represented as an integer.
     """
 
-    patterns = set()
-    for answer in answers:
-        feedback = get_feedback(guess, answer)
-        patterns.add(feedback)
-
-    return patterns
+    return set(get_feedback_batch(guess, answers).tolist())
 
 def complete_entropy(filter: Filter, depth: int) -> None:
     if depth == 0:
@@ -1,3 +1,4 @@
+import math
 import random as rnd
 import threading
 import signal
@@ -12,7 +13,7 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.console import Group, Console
 
-from utils import WORDS, args, format_feedback, get_feedback
+from utils import CPU_COUNT, WORDS, args, format_feedback, get_feedback
 
 from wordle_solver import candidate_scorers as cs
 from wordle_solver.solver import Filter
@@ -39,10 +40,10 @@ def play_single_game(answer: str, scorer=SCORER, display_guesses: bool=False) ->
     """
 
     filter = Filter()
-    guesses = 0
 
-    while True:
-        if guesses == 0 and hasattr(scorer, "FIRST_GUESS"):
+    # Stop if guesses exceed a reasonable upper limit to avoid infinite loops
+    for guesses in range(1, MAX_GUESSES * 2 + 1):
+        if guesses == 1 and hasattr(scorer, "FIRST_GUESS"):
             guess = scorer.FIRST_GUESS
             if display_guesses:
                 print(f"First guess:".ljust(30) + guess, end="\t")
@@ -57,14 +58,13 @@ def play_single_game(answer: str, scorer=SCORER, display_guesses: bool=False) ->
                     print("OUT OF CANDIDATES!")
                 with PRINT_LOCK:
                     print(f"Game ran out of candidates ({answer=}, {filter.greens=}, {filter.yellows=}, {filter.greys=})")
-                return False, guesses
+                return False, guesses - 1
 
             guess = scorer(candidates).best(show_progress=display_guesses)[0]
 
             if display_guesses:
-                print(f"Guess {guesses+1} from {len(candidates)} cands:".ljust(30) + guess, end="\t")
+                print(f"Guess {guesses} from {len(candidates)} cands:".ljust(30) + guess, end="\t")
 
-        guesses += 1
         if guess == answer:
             return True, guesses
 
@@ -75,9 +75,30 @@ def play_single_game(answer: str, scorer=SCORER, display_guesses: bool=False) ->
 
         filter.update(guess, feedback)
 
-        # Stop if guesses exceed a reasonable upper limit to avoid infinite loops
-        if guesses > MAX_GUESSES * 2:
-            return False, guesses
+    return False, guesses
+
+def play_games(games: List[Tuple[int, str]]) -> List[Tuple[str, bool, int]]:
+    """
+    Plays a chunk of games one after another, so that a single submitted future covers many games.
+
+    Args:
+        games (List[Tuple[int, str]]): (game number, answer) pairs to play.
+
+    Returns:
+        List[Tuple[str, bool, int]]: (answer, success, number_of_guesses) for each game.
+        Games that raise are reported as failures using MAX_GUESSES + 1 guesses.
+    """
+
+    results = []
+    for game_num, answer in games:
+        try:
+            success, guesses = play_single_game(answer)
+        except Exception as exc:
+            with PRINT_LOCK:
+                print(f"Error in game {game_num}: {exc}")
+            success, guesses = False, MAX_GUESSES + 1
+        results.append((answer, success, guesses))
+    return results
 
 def generate_stats_table(num_games, games_played, wins, total_guesses, guess_distribution, example_words):
     table = Table.grid(expand=True)
@@ -109,13 +130,13 @@ def generate_stats_table(num_games, games_played, wins, total_guesses, guess_dis
     )
     return group
 
-def run_simulation(num_games: int = 1000, max_workers: int = 8) -> float:
+def run_simulation(num_games: int = 1000, max_workers: int = CPU_COUNT) -> float:
     """
     Runs multiple games and prints statistics about the bot's performance.
 
     Args:
         num_games (int): Number of games to simulate.
-        max_workers (int): Number of threads to use.
+        max_workers (int): Number of threads to use. Defaults to the number of CPUs available to this process.
 
     Returns:
         float: Performance percentage of the bot.
@@ -131,6 +152,11 @@ def run_simulation(num_games: int = 1000, max_workers: int = 8) -> float:
 
     answers = rnd.choices(WORDS, k=min(num_games, len(WORDS)))
 
+    # Submit games in chunks rather than one future per game to cut scheduling overhead
+    games = list(enumerate(answers, start=1))
+    chunk_size = max(1, math.ceil(len(games) / (max_workers * 4)))
+    chunks = [games[i:i + chunk_size] for i in range(0, len(games), chunk_size)]
+
     console = Console()
     if Progress is not None:
         with Progress(
@@ -146,49 +172,37 @@ def run_simulation(num_games: int = 1000, max_workers: int = 8) -> float:
             task = progress.add_task(f"Running {num_games} games in {max_workers} threads...", total=num_games)
 
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_game = {executor.submit(play_single_game, answer): (idx+1, answer) for idx, answer in enumerate(answers)}
+                futures = [executor.submit(play_games, chunk) for chunk in chunks]
 
                 games_played = 0
-                for future in as_completed(future_to_game):
-                    game_num, answer = future_to_game[future]
-                    progress.advance(task)
-                    try:
-                        success, guesses = future.result()
-                    except Exception as exc:
-                        with PRINT_LOCK:
-                            print(f"Error in game {game_num}: {exc}")
-                        success, guesses = False, MAX_GUESSES + 1
+                for future in as_completed(futures):
+                    for answer, success, guesses in future.result():
+                        progress.advance(task)
+
+                        guess_distribution[guesses] += 1
+                        if guesses not in example_words:
+                            example_words[guesses] = answer
+                        total_guesses += guesses
+                        if success and guesses <= MAX_GUESSES:
+                            wins += 1
+                        games_played += 1
+
+                    # Update display once per finished chunk to reduce flicker
+                    stats_group = generate_stats_table(num_games, games_played, wins, total_guesses, guess_distribution, example_words)
+                    console.clear()
+                    console.print(stats_group)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(play_games, chunk) for chunk in chunks]
 
+            for future in as_completed(futures):
+                for answer, success, guesses in future.result():
                     guess_distribution[guesses] += 1
                     if guesses not in example_words:
                         example_words[guesses] = answer
                     total_guesses += guesses
                     if success and guesses <= MAX_GUESSES:
                         wins += 1
-                    games_played += 1
-
-                    # Update display only every 10 games to reduce flicker
-                    if games_played % 10 == 0 or games_played == num_games:
-                        stats_group = generate_stats_table(num_games, games_played, wins, total_guesses, guess_distribution, example_words)
-                        console.clear()
-                        console.print(stats_group)
-    else:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_game = {executor.submit(play_single_game, answer): (idx+1, answer) for idx, answer in enumerate(answers)}
-
-            for future in as_completed(future_to_game):
-                game_num, answer = future_to_game[future]
-                try:
-                    success, guesses = future.result()
-                except Exception as exc:
-                    success, guesses = False, MAX_GUESSES + 1
-
-                guess_distribution[guesses] += 1
-                if guesses not in example_words:
-                    example_words[guesses] = answer
-                total_guesses += guesses
-                if success and guesses <= MAX_GUESSES:
-                    wins += 1
 
     with PRINT_LOCK:
         print(f"Games played: {num_games}")
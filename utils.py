@@ -1,8 +1,14 @@
 import argparse
 import atexit
+import hashlib
+import itertools
 import os
 import sqlite3
 import sys
+import tempfile
+import threading
+
+import numpy as np
 
 # Argument Parser
 parser = argparse.ArgumentParser()
@@ -14,11 +20,15 @@ if 'ipykernel' in sys.modules:
     # Running inside Jupyter notebook, ignore argv
     args = parser.parse_args(args=[])
 else:
-    args = parser.parse_args()
+    # Leave unknown flags to the script importing utils
+    args, _ = parser.parse_known_args()
 
-def load_words_from_file(file: str) -> list[str]:
+# Number of CPUs this process may actually run on, respecting affinity masks and container CPU sets
+CPU_COUNT = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 4)
+
+def _load_letter_rows(file: str) -> np.ndarray:
     """
-    Loads words from a specified file.
+    Loads the words of a specified file as rows of lowercase ASCII letters.
 
     If the file does not exist in the current directory, it is assumed to be in the same directory as this script.
     If the file does not have an extension, '.txt' is appended to the end of the name.
@@ -27,7 +37,7 @@ def load_words_from_file(file: str) -> list[str]:
         file (str): The filename of the file from which to load words.
 
     Returns:
-        list[str]: A list of words from the file, all of which are the same length as specified by the command line argument.
+        np.ndarray: A (K, length) uint8 array holding one word of the command line length per row.
     """
 
     # Caution where extension is not specified
@@ -40,11 +50,46 @@ def load_words_from_file(file: str) -> list[str]:
         if not os.path.exists(file):
             raise FileNotFoundError(f"File {file} does not exist in the current directory.")
 
-    with open(file, "r") as f:
-        wordset = f.read().splitlines()
-        print("Words loaded from", file)
-    
-    return [w.lower() for w in wordset if w.isalpha() and len(w) == args.length]
+    data = np.fromfile(file, dtype=np.uint8)
+    print("Words loaded from", file)
+
+    # Locate every line from the newline offsets, dropping any carriage return before the newline
+    ends = np.flatnonzero(data == ord("\n"))
+    if len(data) and data[-1] != ord("\n"):
+        ends = np.append(ends, len(data))
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    ends = ends - ((ends > starts) & (data[np.maximum(ends - 1, 0)] == ord("\r")))
+
+    # Gather the lines of the right length as rows of letters, lowercase them and keep the all-letter rows
+    starts = starts[ends - starts == args.length]
+    letters = data[starts[:, None] + np.arange(args.length)]
+    upper = (letters >= ord("A")) & (letters <= ord("Z"))
+    letters = letters + upper * np.uint8(ord("a") - ord("A"))
+    return letters[((letters >= ord("a")) & (letters <= ord("z"))).all(axis=1)]
+
+def _decode_letter_rows(letters: np.ndarray) -> list[str]:
+    """
+    Converts rows of ASCII letters back into words with a single decode.
+    """
+
+    joined = letters.tobytes().decode("ascii")
+    return [joined[i:i + args.length] for i in range(0, len(joined), args.length)]
+
+def load_words_from_file(file: str) -> list[str]:
+    """
+    Loads words from a specified file.
+
+    If the file does not exist in the current directory, it is assumed to be in the same directory as this script.
+    If the file does not have an extension, '.txt' is appended to the end of the name.
+
+    Args:
+        file (str): The filename of the file from which to load words.
+
+    Returns:
+        list[str]: A list of words from the file, all of which are the same length as specified by the command line argument.
+    """
+
+    return _decode_letter_rows(_load_letter_rows(file))
 
 def load_words_from_all_files() -> list[str]:
     """
@@ -52,17 +97,17 @@ def load_words_from_all_files() -> list[str]:
     
     Scans the current directory for files with the .txt extension, and loads all words from them, 
     all of which must be the same length as specified by the command line argument.
+    Duplicates across files are removed on the raw letter rows, so each word is decoded once.
     
     Returns:
-        list[str]: A list of all words from all text files.
+        list[str]: A sorted list of all words from all text files.
     """
 
-    wordset = set()
-    for file in os.listdir():
-        if file.endswith(".txt"):
-            wordset.update(load_words_from_file(file))
-    
-    return list(wordset)
+    rows = [_load_letter_rows(file) for file in os.listdir() if file.endswith(".txt")]
+    if not rows:
+        return []
+
+    return _decode_letter_rows(np.unique(np.concatenate(rows), axis=0))
 
 if args.wordlist != "all":
     WORDS = load_words_from_file(args.wordlist)
@@ -73,81 +118,427 @@ WORDS.sort()
 if not WORDS:
     raise Exception("No words found in wordlist or no wordlists found.")
 
-# Ensure feedback directory exists
-feedback_dir = os.path.join(os.getcwd(), "feedback")
-if not os.path.exists(feedback_dir):
-    os.makedirs(feedback_dir)
-
-# SQLite database setup for feedback map in feedback directory
-DB_PATH = os.path.join(feedback_dir, "feedback.db")
-conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-cursor = conn.cursor()
-
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS entropy (
-    guess TEXT NOT NULL,
-    answer TEXT NOT NULL DEFAULT '',
-    entropy REAL,
-    candidate_set_hash TEXT,
-    PRIMARY KEY (guess, answer, candidate_set_hash)
-)
-""")
-conn.commit()
+# Constant-time membership checks for validating guesses
+WORDS_SET = frozenset(WORDS)
 
-def format_candidates(candidates: list[str]) -> str:
-    return "".join(word.ljust(10 + args.length) for word in candidates)
+# SQLite database for cached entropy rows in the feedback directory.
+# It is opened on first use, so importing utils only reads the wordlists.
+DB_PATH = os.path.join(os.getcwd(), "feedback", "feedback.db")
+conn = None
+_word_ids = None
+# Serialises use of the shared connection, which the scorers of every thread write through
+DB_LOCK = threading.RLock()
+
+def open_database() -> sqlite3.Connection:
+    """
+    Returns the shared connection to the feedback database, creating the directory, tables and connection on first use.
+    """
+
+    with DB_LOCK:
+        if conn is None:
+            _create_database()
+    return conn
+
+def _create_database() -> None:
+    """
+    Creates the feedback directory, tables and shared connection.
+    """
+
+    global conn
+
+    # Ensure feedback directory exists
+    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    cursor = conn.cursor()
+
+    # WAL is persistent on the database file, so every later connection to it commits without a full journal fsync
+    cursor.execute("PRAGMA journal_mode=WAL;")
+    cursor.execute("PRAGMA synchronous=NORMAL;")
+    cursor.execute("PRAGMA temp_store=MEMORY;")
+    cursor.execute("PRAGMA cache_size=-65536;")
+
+    # Words are stored once with a stable integer id, so that entropy rows key on small integers instead of text.
+    # Entropy rows lead with the candidate set hash, so a scorer's prefetch reads one contiguous key range.
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS words (
+        id INTEGER PRIMARY KEY,
+        word TEXT NOT NULL UNIQUE
+    )
+    """)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS entropy_scores (
+        guess_id INTEGER NOT NULL,
+        candidate_set_hash INTEGER NOT NULL,
+        entropy REAL,
+        PRIMARY KEY (candidate_set_hash, guess_id)
+    ) WITHOUT ROWID
+    """)
+    cursor.close()
+    conn.commit()
+
+    # Also commit the database on program exit
+    atexit.register(conn.commit)
+
+def get_word_ids() -> dict[str, int]:
+    """
+    Returns the database id of every word in WORDS, registering any words the database has not seen yet.
+    """
+
+    global _word_ids
 
-# Also commit feedback map on program exit
-atexit.register(conn.commit)
+    with DB_LOCK:
+        if _word_ids is not None:
+            return _word_ids
 
-_feedback_cache = {}
+        cursor = open_database().cursor()
+        word_ids = dict(cursor.execute("SELECT word, id FROM words"))
+        new_words = [(word,) for word in WORDS if word not in word_ids]
+        if new_words:
+            cursor.executemany("INSERT OR IGNORE INTO words (word) VALUES (?)", new_words)
+            conn.commit()
+            word_ids = dict(cursor.execute("SELECT word, id FROM words"))
+        cursor.close()
+        _word_ids = word_ids
+
+    return _word_ids
+
+def hash_candidate_set(candidates: list[str]) -> int:
+    """
+    Returns a 64-bit integer hash of a candidate set, independent of candidate order, for keying entropy rows.
+    """
+
+    digest = hashlib.sha256(",".join(sorted(candidates)).encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+def format_candidates(candidates: list[str]) -> str:
+    return "".join(word.ljust(10 + args.length) for word in candidates)
 
 ord_dict = {c: i for i, c in enumerate("abcdefghijklmnopqrstuvwxyz")}
 
-def get_feedback(guess: str, answer: str) -> int:
+def _compute_feedback(guess: str, answer: str) -> int:
     """
     Implements Wordle feedback logic from scratch, ensuring correct handling of repeated letters.
     2 bits per position: 00=grey, 01=yellow, 10=green.
     """
 
-    cache_key = (guess, answer)
-    if cache_key in _feedback_cache:
-        return _feedback_cache[cache_key]
-    # Feedback has the same result for reversed guess and answer
-    if (answer, guess) in _feedback_cache:
-        return _feedback_cache[(answer, guess)]
-
     feedback_num = 0
     length = len(guess)
+    guess_bytes = guess.encode("ascii")
+    answer_bytes = answer.encode("ascii")
 
-    # Count letters in answer manually without Counter
-    answer_letter_counts = {ch: answer.count(ch) for ch in set(answer)}
+    # Count letters in answer in a fixed 26-slot array
+    answer_letter_counts = bytearray(26)
+    for ch in answer_bytes:
+        answer_letter_counts[ch - 97] += 1
 
     green_positions = [False] * length
 
     for i in range(length):
-        if guess[i] == answer[i]:
+        if guess_bytes[i] == answer_bytes[i]:
             feedback_num |= 2 << (2 * i) # green
-            answer_letter_counts[guess[i]] -= 1
+            answer_letter_counts[guess_bytes[i] - 97] -= 1
             green_positions[i] = True
 
     for i in range(length):
         if not green_positions[i]:
-            if guess[i] in answer_letter_counts and answer_letter_counts[guess[i]] > 0:
+            slot = guess_bytes[i] - 97
+            if answer_letter_counts[slot]:
                 feedback_num |= 1 << (2 * i) # yellow
-                answer_letter_counts[guess[i]] -= 1
-
-    _feedback_cache[cache_key] = feedback_num
+                answer_letter_counts[slot] -= 1
 
     return feedback_num
 
-def format_feedback(feedback_num: int) -> str:
+WORD_INDEX = {word: i for i, word in enumerate(WORDS)}
+
+FEEDBACK_DTYPE = np.uint16 if 2 * args.length <= 16 else np.uint32
+
+def encode_words(words: list[str]) -> np.ndarray:
     """
-    Formats the feedback number back into a string of 'g', 'y', 'x' for printing.
+    Encodes equal-length lowercase words for vectorised feedback.
+
+    Returns:
+        np.ndarray: A (length, N) uint8 array of letter codes 0-25, one contiguous row per letter position.
+    """
+
+    if not words:
+        return np.empty((args.length, 0), dtype=np.uint8)
+    codes = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8) - ord("a")
+    return np.ascontiguousarray(codes.reshape(len(words), -1).T)
+
+WORD_CODES = encode_words(WORDS)
+
+PACKED_DTYPE = np.uint32 if 5 * args.length <= 32 else np.uint64
+# Bit 0 of every 5-bit letter lane
+LANE_LOW_BITS = sum(1 << (5 * i) for i in range(args.length))
+
+def pack_words(words: list[str]) -> np.ndarray:
+    """
+    Packs equal-length lowercase words into integers holding 5 bits per letter, first letter lowest.
+
+    Returns:
+        np.ndarray: An (N,) array of packed words.
+    """
+
+    codes = encode_words(words).astype(PACKED_DTYPE)
+    packed = np.zeros(codes.shape[1], dtype=PACKED_DTYPE)
+    for i in range(codes.shape[0]):
+        packed |= codes[i] << PACKED_DTYPE(5 * i)
+    return packed
+
+WORDS_PACKED = pack_words(WORDS)
+
+def lane_equal(packed: np.ndarray, pattern: int) -> np.ndarray:
+    """
+    Compares every 5-bit letter lane of packed words against the same lane of a packed pattern.
+
+    Args:
+        packed (np.ndarray): Packed words, as returned by pack_words.
+        pattern (int): A packed word or partial word to compare against.
+
+    Returns:
+        np.ndarray: Bit 0 of each lane is set where the lanes are equal; all other bits are clear.
+    """
+
+    same = ~(packed ^ PACKED_DTYPE(pattern))
+    same &= (same >> PACKED_DTYPE(1)) & (same >> PACKED_DTYPE(2)) & (same >> PACKED_DTYPE(3)) & (same >> PACKED_DTYPE(4))
+    return same & PACKED_DTYPE(LANE_LOW_BITS)
+
+def feedback_matrix(guesses: np.ndarray, answers: np.ndarray) -> np.ndarray:
+    """
+    Vectorised get_feedback of many encoded guesses against many encoded answers.
+
+    A non-green guess letter is yellow when the answer holds more non-green copies of it than
+    there are non-green copies of it earlier in the guess, which matches the left-to-right
+    yellow assignment of get_feedback.
+
+    Args:
+        guesses (np.ndarray): Guesses encoded by encode_words, shape (length, B).
+        answers (np.ndarray): Answers encoded by encode_words, shape (length, M).
+
+    Returns:
+        np.ndarray: Packed feedback numbers of shape (B, M).
+    """
+
+    length = guesses.shape[0]
+    guess_letters = guesses[:, :, None]
+    greens = [answers[i] == guess_letters[i] for i in range(length)]
+    not_greens = [~green for green in greens]
+
+    feedback = np.zeros((guesses.shape[1], answers.shape[1]), dtype=FEEDBACK_DTYPE)
+    for i in range(length):
+        # Non-green copies of this letter left in the answer, minus those claimed earlier in the guess
+        available = np.zeros(feedback.shape, dtype=np.int8)
+        for j in range(length):
+            available += (answers[j] == guess_letters[i]) & not_greens[j]
+        for k in range(i):
+            available -= (guess_letters[k] == guess_letters[i]) & not_greens[k]
+        yellows = not_greens[i] & (available > 0)
+
+        feedback |= greens[i] * FEEDBACK_DTYPE(2 << (2 * i))
+        feedback |= yellows * FEEDBACK_DTYPE(1 << (2 * i))
+
+    return feedback
+
+# Guesses per feedback_matrix call when filling many rows at once
+FEEDBACK_BLOCK_SIZE = 16
+
+# Shared (N, N) feedback table over WORDS, filled lazily one guess row at a time.
+# Threads of one process all read and fill the same rows. Once a full table has been stored on disk it is
+# memory-mapped read-only instead, so every process shares the same page-cache copy.
+FEEDBACK = None
+_POPULATED = None
+_feedback_table_lock = threading.Lock()
+_precompute_lock = threading.Lock()
+
+def _load_stored_feedback_table() -> bool:
+    """
+    Maps the stored full feedback table read-only as the shared table, if one exists for the current word list.
+
+    Returns:
+        bool: Whether the stored table was mapped.
+    """
+
+    global FEEDBACK, _POPULATED
+
+    path = feedback_table_path()
+    if not os.path.exists(path):
+        return False
+
+    try:
+        stored = np.load(path, mmap_mode="r")
+    except Exception as e:
+        print(f"Error loading feedback table from {path}: {e}")
+        return False
+    if stored.shape != (len(WORDS), len(WORDS)) or stored.dtype != FEEDBACK_DTYPE:
+        print(f"Ignoring feedback table {path} built for a different word list.")
+        return False
+
+    _POPULATED = np.ones(len(WORDS), dtype=np.uint8)
+    FEEDBACK = stored
+    return True
+
+def _open_feedback_table() -> None:
+    """
+    Opens the feedback table on first use, preferring the stored table over a new in-memory one.
+    """
+
+    global FEEDBACK, _POPULATED
+
+    with _feedback_table_lock:
+        # Another thread may have opened the table while this one waited
+        if FEEDBACK is not None or _load_stored_feedback_table():
+            return
+
+        n = len(WORDS)
+        # Zero-filled lazily by the OS; pages are only committed once a row is written.
+        # The flags are set first, since callers test FEEDBACK to see whether the table is open.
+        _POPULATED = np.zeros(n, dtype=np.uint8)
+        FEEDBACK = np.zeros((n, n), dtype=FEEDBACK_DTYPE)
+
+def feedback_row(guess_idx: int) -> np.ndarray:
+    """
+    Returns the feedback of WORDS[guess_idx] against every word in WORDS, computing the shared row on first use.
+
+    Rows are written in full before they are flagged as populated, and concurrent fills of the same row
+    write identical values, so no lock is needed.
+    """
+
+    if FEEDBACK is None:
+        _open_feedback_table()
+
+    if not _POPULATED[guess_idx]:
+        FEEDBACK[guess_idx] = feedback_matrix(WORD_CODES[:, guess_idx:guess_idx + 1], WORD_CODES)[0]
+        _POPULATED[guess_idx] = 1
+
+    return FEEDBACK[guess_idx]
+
+def fill_feedback_rows(guess_idxs) -> None:
+    """
+    Computes every unpopulated row among guess_idxs, FEEDBACK_BLOCK_SIZE guesses per kernel call.
+
+    Batching guesses amortises the kernel's per-call overhead, making each row roughly 4x cheaper than
+    filling it through feedback_row.
+
+    Args:
+        guess_idxs (Iterable[int]): Indices in WORDS of the guesses whose rows are needed.
+    """
+
+    if FEEDBACK is None:
+        _open_feedback_table()
+
+    guess_idxs = np.unique(np.fromiter(guess_idxs, dtype=np.intp))
+    missing = guess_idxs[_POPULATED[guess_idxs] == 0]
+
+    for start in range(0, len(missing), FEEDBACK_BLOCK_SIZE):
+        block = missing[start:start + FEEDBACK_BLOCK_SIZE]
+        FEEDBACK[block] = feedback_matrix(WORD_CODES[:, block], WORD_CODES)
+        _POPULATED[block] = 1
+
+def feedback_block(guess_idxs: np.ndarray, answer_idxs: np.ndarray) -> np.ndarray:
+    """
+    Returns the (len(guess_idxs), len(answer_idxs)) feedback of each guess against each answer, filling any
+    missing rows of the shared table first.
+
+    Args:
+        guess_idxs (np.ndarray): Indices in WORDS of the guesses.
+        answer_idxs (np.ndarray): Indices in WORDS of the answers.
+    """
+
+    fill_feedback_rows(guess_idxs)
+    return FEEDBACK[np.ix_(guess_idxs, answer_idxs)]
+
+def feedback_table_path() -> str:
+    """
+    Returns the path of the on-disk copy of the full feedback table, named after the word list it was built from.
+    """
+
+    words_hash = hash_candidate_set(WORDS) & 0xFFFFFFFFFFFFFFFF
+    return os.path.join(os.path.dirname(DB_PATH), f"feedback_table_{words_hash:016x}.npy")
+
+def precompute_feedback_table() -> None:
+    """
+    Fills the whole shared feedback table up front.
+
+    The filled table is saved next to the feedback database, so later runs over the same word list
+    map it from disk instead of recomputing every row.
+    """
+
+    if FEEDBACK is None:
+        _open_feedback_table()
+
+    if _POPULATED.all():
+        return
+
+    # One thread fills and stores the table; any other waits here and then finds every row populated
+    with _precompute_lock:
+        if _POPULATED.all():
+            return
+
+        # Another process may have stored the table since this one started filling its own
+        path = feedback_table_path()
+        if os.path.exists(path):
+            try:
+                stored = np.load(path, mmap_mode="r")
+                if stored.shape == FEEDBACK.shape and stored.dtype == FEEDBACK.dtype:
+                    FEEDBACK[:] = stored
+                    _POPULATED[:] = 1
+                    return
+            except Exception as e:
+                print(f"Error loading feedback table from {path}: {e}")
+
+        fill_feedback_rows(range(len(WORDS)))
+
+        # Written under a unique temporary name and then renamed, so a partial file is never loaded
+        temp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                np.save(file, FEEDBACK)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Error saving feedback table to {path}: {e}")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+def get_feedback_idx(guess_idx: int, answer_idx: int) -> int:
+    """
+    Returns the feedback for a guess and answer given by their indices in WORDS.
+    """
+
+    return int(feedback_row(guess_idx)[answer_idx])
+
+def get_feedback(guess: str, answer: str) -> int:
+    """
+    Returns the Wordle feedback for guess against answer.
+    2 bits per position: 00=grey, 01=yellow, 10=green.
+
+    Pairs of words from WORDS are served from the shared feedback table; anything else is computed directly.
+    """
+
+    guess_idx = WORD_INDEX.get(guess)
+    answer_idx = WORD_INDEX.get(answer)
+    if guess_idx is None or answer_idx is None:
+        return _compute_feedback(guess, answer)
+
+    return get_feedback_idx(guess_idx, answer_idx)
+
+def get_feedback_batch(guess: str, answers: list[str]) -> np.ndarray:
+    """
+    Returns the feedback for guess against every word in answers, computed in one vectorised pass.
+    """
+
+    return feedback_matrix(encode_words([guess]), encode_words(answers))[0]
+
+def _format_feedback_slow(feedback_num: int, length: int) -> str:
+    """
+    Formats the feedback number back into a string of 'g', 'y', 'x' by decoding each position.
+    Only used to build the feedback lookup tables.
     """
 
     feedback_str = []
-    for i in range(args.length):
+    for i in range(length):
         # Extract 2 bits for position i
         bits = (feedback_num >> (2 * i)) & 0b11
         if bits == 2:
@@ -160,6 +551,33 @@ def format_feedback(feedback_num: int) -> str:
             raise Exception(f"Invalid feedback bits: {bits} from feedback number {feedback_num}.")
     return "".join(feedback_str)
 
-def intify_feedback(feedback: str) -> int:
+def _intify_feedback_slow(feedback: str) -> int:
     reversed_feedback = feedback[::-1]
-    return int(reversed_feedback.replace("g", "10").replace("y", "01").replace("x", "00"), 2)
\ No newline at end of file
+    return int(reversed_feedback.replace("g", "10").replace("y", "01").replace("x", "00"), 2)
+
+# Lookup tables covering every valid feedback for the current word length (3 ** length entries)
+FB_STR_TO_INT = {
+    feedback_str: _intify_feedback_slow(feedback_str)
+    for feedback_str in ("".join(colours) for colours in itertools.product("gyx", repeat=args.length))
+}
+FB_INT_TO_STR = {feedback_num: _format_feedback_slow(feedback_num, args.length) for feedback_num in FB_STR_TO_INT.values()}
+
+def format_feedback(feedback_num: int) -> str:
+    """
+    Formats the feedback number back into a string of 'g', 'y', 'x' for printing.
+    """
+
+    try:
+        return FB_INT_TO_STR[feedback_num]
+    except KeyError:
+        raise Exception(f"Invalid feedback number {feedback_num}.") from None
+
+def intify_feedback(feedback: str) -> int:
+    """
+    Converts a string of 'g', 'y', 'x' into the packed feedback number used by get_feedback.
+    """
+
+    try:
+        return FB_STR_TO_INT[feedback]
+    except KeyError:
+        raise Exception(f"Invalid feedback string {feedback!r}.") from None
\ No newline at end of file
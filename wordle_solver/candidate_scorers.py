@@ -1,17 +1,14 @@
-import hashlib
 import heapq
 import math
-import multiprocessing
-import os
 import signal
-import sqlite3
 import threading
 
-from collections import defaultdict, Counter
-from functools import lru_cache
+from collections import defaultdict
 from typing import List, Union
 
-from utils import get_feedback, WORDS
+import numpy as np
+
+from utils import encode_words, feedback_block, feedback_matrix, feedback_row, get_feedback, get_feedback_batch, get_word_ids, hash_candidate_set, open_database, precompute_feedback_table, DB_LOCK, WORD_INDEX, WORDS
 
 from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn, SpinnerColumn
 
@@ -19,43 +16,135 @@ def _best_with_progress(scorer, n=1, show_progress=False, description="Calculati
     """
     Helper function to compute top n candidates with optional rich progress bar.
     Uses scorer.candidates and scorer.score method.
+    Scorers with a score_all method are ranked in one vectorised call when no func is given,
+    which shows no progress bar, so show_progress has no effect on that path.
+    A negative n ranks every candidate. The result is always a list, best first.
     """
     if candidates is None:
         candidates = scorer.candidates
-    if func is None:
+    # Rank by the scorer's own score in one vectorised call when it supports it
+    vectorised = func is None and hasattr(scorer, "score_all")
+    if func is None and not vectorised:
         func = scorer.score
+    if n < 0:
+        n = len(candidates)
 
     if len(scorer.candidates) == 1:
-        return scorer.candidates[0]
+        return [scorer.candidates[0]]
     elif len(scorer.candidates) == 0:
         return []
 
+    if vectorised:
+        return _top_n(scorer.score_all(candidates), n, candidates)
+
+    # Every candidate is scored exactly once before ranking
     if not show_progress:
-        if n == 1:
-            return [max(candidates, key=func)]
-        else:
-            return [candidate for candidate, score in heapq.nlargest(n, ((c, func(c)) for c in candidates), key=lambda x: x[1])]
+        scores = np.fromiter((func(candidate) for candidate in candidates), dtype=float, count=len(candidates))
     else:
-        scores = []
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeElapsedColumn(),
-        TimeRemainingColumn(),
-        TextColumn("{task.fields[current_word]}", justify="right"),
-    ) as progress:
-        task = progress.add_task(f"[green]{description}", total=len(candidates), current_word="")
-        for i, candidate in enumerate(candidates):
-            scores.append((candidate, func(candidate)))
-            progress.update(task, advance=1, current_word=f"[bright_blue]{candidate}")
-        progress.update(task, completed=len(candidates))
-
-        if n == 1:
-            return max(scores, key=lambda x: x[1])[0]
-        else:
-            return [candidate for candidate, score in heapq.nlargest(n, scores, key=lambda x: x[1])]
+        scores = np.empty(len(candidates))
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeElapsedColumn(),
+            TimeRemainingColumn(),
+            TextColumn("{task.fields[current_word]}", justify="right"),
+        ) as progress:
+            task = progress.add_task(f"[green]{description}", total=len(candidates), current_word="")
+            for i, candidate in enumerate(candidates):
+                scores[i] = func(candidate)
+                progress.update(task, advance=1, current_word=f"[bright_blue]{candidate}")
+            progress.update(task, completed=len(candidates))
+
+    return _top_n(scores, n, candidates)
+
+def _top_n(scores: np.ndarray, n: int, words: list[str]) -> list[str]:
+    """
+    Returns the n highest scoring words, best first, with ties kept in word order.
+
+    Args:
+        scores (np.ndarray): The score of each word.
+        n (int): Number of words to return.
+        words (list[str]): The scored words.
+
+    Returns:
+        list[str]: The top n words.
+    """
+
+    if 0 < n < len(scores) // 2:
+        # Select the top n in linear time and only sort those; ties at the nth score go to the earliest words
+        kth = -np.partition(-scores, n - 1)[n - 1]
+        above = np.flatnonzero(scores > kth)
+        tied = np.flatnonzero(scores == kth)[:n - len(above)]
+        top = np.concatenate((above, tied))
+        return [words[i] for i in top[np.argsort(-scores[top], kind="stable")]]
+    # The stable sort keeps ties in word order
+    return [words[i] for i in np.argsort(-scores, kind="stable")[:n]]
+
+# Upper bound on the feedbacks or histogram cells handled by a single bincount in _partition_counts
+ENTROPY_BLOCK_CELLS = 1 << 22
+
+def _partition_counts(feedbacks: np.ndarray):
+    """
+    Counts the size of every feedback partition of each row, a block of rows at a time.
+
+    Every row's feedbacks are offset into their own range of bins so that a block of rows is counted by
+    one bincount, rather than one call per row.
+
+    Args:
+        feedbacks (np.ndarray): (B, K) feedback of B guesses against the same K answers.
+
+    Yields:
+        tuple[int, np.ndarray]: The first row of each block and the block's (rows, patterns) partition sizes.
+    """
+
+    rows, answers = feedbacks.shape
+    if rows == 0 or answers == 0:
+        return
+
+    width = int(feedbacks.max()) + 1
+    block_rows = max(1, ENTROPY_BLOCK_CELLS // max(width, answers))
+    for start in range(0, rows, block_rows):
+        block = feedbacks[start:start + block_rows].astype(np.int64)
+        block += (np.arange(len(block), dtype=np.int64) * width)[:, None]
+        yield start, np.bincount(block.ravel(), minlength=len(block) * width).reshape(len(block), width)
+
+def _partition_entropies(feedbacks: np.ndarray) -> np.ndarray:
+    """
+    Computes the entropy of each row's feedback distribution.
+
+    Args:
+        feedbacks (np.ndarray): (B, K) feedback of B guesses against the same K answers.
+
+    Returns:
+        np.ndarray: (B,) entropy of each guess in bits.
+    """
+
+    entropies = np.zeros(feedbacks.shape[0])
+    for start, counts in _partition_counts(feedbacks):
+        probabilities = counts / feedbacks.shape[1]
+        # Empty partitions contribute nothing; log2 of 1 keeps them at zero
+        entropies[start:start + len(counts)] = -(probabilities * np.log2(np.where(counts > 0, probabilities, 1))).sum(axis=1)
+
+    return entropies
+
+def _partition_square_sums(feedbacks: np.ndarray) -> np.ndarray:
+    """
+    Computes the sum of squared partition sizes of each row, i.e. the total candidates left over all answers.
+
+    Args:
+        feedbacks (np.ndarray): (B, K) feedback of B guesses against the same K answers.
+
+    Returns:
+        np.ndarray: (B,) total remaining candidates for each guess.
+    """
+
+    totals = np.zeros(feedbacks.shape[0], dtype=np.int64)
+    for start, counts in _partition_counts(feedbacks):
+        totals[start:start + len(counts)] = (counts * counts).sum(axis=1)
+
+    return totals
 
 class IntuitiveScorer:
 
@@ -73,44 +162,52 @@ class IntuitiveScorer:
 
     def __init__(self, candidates: list[str]):
         self.candidates = candidates
-        self._caches_calculated = False
+        self._calculate_caches()
 
     def _calculate_caches(self) -> None:
         """
         Calculate and store caches used for scoring candidates.
         """
-        if self._caches_calculated:
-            return
-
-        letter_counts = {}
-        total_letters = 0
-        length = 0
-        for word in self.candidates:
-            length = len(word)
-            for char in word:
-                letter_counts[char] = letter_counts.get(char, 0) + 1
-                total_letters += 1
-
-        letter_presence = {}
-        for word in self.candidates:
-            unique_chars = set(word)
-            for char in unique_chars:
-                letter_presence[char] = letter_presence.get(char, 0) + 1
-
-        position_counts = [{} for _ in range(length)]
-        for word in self.candidates:
-            if len(word) != length:
-                continue
-            for i, char in enumerate(word):
-                position_counts[i][char] = position_counts[i].get(char, 0) + 1
+
+        # Letter codes with one contiguous row per position, so every count is a bincount over a uint8 array
+        codes = encode_words(self.candidates)
+
+        # One bincount per position; every other letter count is derived from these
+        position_letter_totals = np.array([np.bincount(position, minlength=26) for position in codes])
+        letter_totals = position_letter_totals.sum(axis=0)
+        total_letters = int(codes.size)
+
+        # Each word counts once per distinct letter it contains
+        present = np.zeros((codes.shape[1], 26), dtype=bool)
+        for position in codes:
+            present[np.arange(codes.shape[1]), position] = True
+        presence_totals = present.sum(axis=0)
+
+        letter_counts = {chr(ord("a") + i): int(count) for i, count in enumerate(letter_totals) if count}
+        letter_presence = {chr(ord("a") + i): int(count) for i, count in enumerate(presence_totals) if count}
+        position_counts = [
+            {chr(ord("a") + i): int(count) for i, count in enumerate(totals) if count}
+            for totals in position_letter_totals
+        ]
 
         self._letter_counts = letter_counts
         self._total_letters = total_letters
         self._position_counts = position_counts
         self._letter_presence = letter_presence
         self._total_candidates = len(self.candidates)
+        # Letters counted at each position; constant per candidate set, so summed once here
+        self._position_totals = [sum(counts.values()) for counts in position_counts]
+
+        # Array forms of the same counts, indexed by letter code, for score_all
+        self._letter_totals = letter_totals
+        self._presence_totals = presence_totals
+        self._position_letter_totals = position_letter_totals
 
-        self._caches_calculated = True
+        # Weighted frequency plus presence of each letter; a pure function of the counts, so computed once here
+        freq = letter_totals / total_letters if total_letters > 0 else np.zeros(26)
+        presence = presence_totals / self._total_candidates if self._total_candidates > 0 else np.zeros(26)
+        self._letter_weight_lut = freq * 70 + presence * 40
+        self._letter_weights = {chr(ord("a") + i): float(weight) for i, weight in enumerate(self._letter_weight_lut) if weight}
 
     def score(self, candidate: str) -> float:
         """
@@ -129,7 +226,9 @@ class IntuitiveScorer:
             float: The calculated usefulness score for the candidate word.
         """
 
-        self._calculate_caches()
+        # With no candidates there is nothing to score against, which also rules out a zero total below
+        if self._total_candidates == 0:
+            return 0.0
 
         def positional_letter_bonus(candidate: str, position_counts_cache: list[dict[str, int]]) -> float:
             """
@@ -144,24 +243,26 @@ class IntuitiveScorer:
                 float: The positional letter frequency bonus.
             """
             bonus = 0.0
+            # Every position counts one letter per candidate, so no total is zero
+            position_totals = self._position_totals
+            # Every scored word has the candidates' length, so each position has a count cache
             for i, char in enumerate(candidate):
-                if i >= len(position_counts_cache):
-                    continue
                 char_count = position_counts_cache[i].get(char, 0)
-                total_count = sum(position_counts_cache[i].values())
-                freq = char_count / total_count if total_count > 0 else 0
-                bonus += freq
+                bonus += char_count / position_totals[i]
 
             return bonus * 10
 
+        # Bind the caches to locals once rather than looking each up per letter
+        letter_weights = self._letter_weights
+        letter_presence = self._letter_presence
+        total_candidates = self._total_candidates
+
         score = 0.0
         unique_letters = set(candidate)
 
         for char in unique_letters:
-            freq = self._letter_counts.get(char, 0) / self._total_letters if self._total_letters > 0 else 0
-            presence = self._letter_presence.get(char, 0) / self._total_candidates if self._total_candidates > 0 else 0
-            # Weight frequency and presence, frequency weighted higher
-            score += (freq * 70 + presence * 40)
+            # Weighted frequency and presence, frequency weighted higher
+            score += letter_weights.get(char, 0.0)
 
         # Penalize duplicate letters less harshly
         duplicate_count = len(candidate) - len(unique_letters)
@@ -173,12 +274,47 @@ class IntuitiveScorer:
         # Add bonus for sharing letters with many other candidates
         shared_letter_bonus = 0
         for char in unique_letters:
-            shared_letter_bonus += self._letter_presence.get(char, 0)
+            shared_letter_bonus += letter_presence.get(char, 0)
         # Normalize and weight the shared letter bonus
-        score += (shared_letter_bonus / self._total_candidates) * 100
+        score += (shared_letter_bonus / total_candidates) * 100
 
         return score
 
+    def score_all(self, words: list[str]) -> np.ndarray:
+        """
+        Scores many candidate words at once with the same heuristics as score.
+
+        Args:
+            words (list[str]): The candidate words to score, all of the candidates' length.
+
+        Returns:
+            np.ndarray: The score of each word, in order.
+        """
+
+        if self._total_candidates == 0:
+            return np.zeros(len(words))
+
+        codes = encode_words(words)
+        length, count = codes.shape
+
+        present = np.zeros((count, 26), dtype=bool)
+        for position in codes:
+            present[np.arange(count), position] = True
+
+        # Frequency and presence of each distinct letter, duplicate penalty, then the positional bonus
+        scores = present @ self._letter_weight_lut
+        duplicate_count = length - present.sum(axis=1)
+        scores -= 20 * duplicate_count ** 1.5
+
+        position_freq = self._position_letter_totals / self._position_letter_totals.sum(axis=1, keepdims=True)
+        bonus = sum(position_freq[i, codes[i]] for i in range(length))
+        scores += bonus * 10 * 7.5
+
+        # Bonus for sharing letters with many other candidates
+        scores += (present @ self._presence_totals) / self._total_candidates * 100
+
+        return scores
+
     def best(self, n: int = 1, show_progress: bool=False) -> list[str]:
         return _best_with_progress(self, n=n, show_progress=show_progress, description="Calculating Intuitive scores...")
 
@@ -197,54 +333,93 @@ class ReductionScorer:
 
     def __init__(self, candidates: list[str]):
         self.candidates = candidates
+        self._letter_map = None
 
-    def score(self, candidate: str) -> float:
+        # Columns of the answers in the shared feedback table, or None when an answer is not in WORDS
+        if all(candidate in WORD_INDEX for candidate in self.candidates):
+            self._answer_idxs = np.array([WORD_INDEX[candidate] for candidate in self.candidates], dtype=np.intp)
+        else:
+            self._answer_idxs = None
+
+    def _letter_frequencies(self) -> dict[str, float]:
+        """
+        Returns the average number of times each letter occurs per candidate, counted once per candidate set.
+        """
+        if self._letter_map is None:
+            totals = np.bincount(encode_words(self.candidates).ravel(), minlength=26)
+            self._letter_map = {chr(ord("a") + i): int(count) / len(self.candidates) for i, count in enumerate(totals) if count}
+        return self._letter_map
 
-        from wordle_solver.filter import Filter
+    def score(self, candidate: str) -> float:
 
-        # Collect a letter map of remaining candidates and reward candidates that use letters with lower frequencies
-        letter_map = {}
         score = 0
 
-        # Averaging of remaining candidates
-        total_remaining = 0
         candidates = self.candidates
         num_candidates = len(candidates)
         if num_candidates == 0:
             return 0.0
 
-        for answer in candidates:
-            feedback = get_feedback(candidate, answer)
-            filter = Filter(length=len(candidate))
-            filter.update(candidate, feedback)
-            filtered_candidates = filter.strict_candidates(candidates)
-            total_remaining += len(filtered_candidates)
-
-            # Collect letter frequencies
-            for i, char in enumerate(answer):
-                letter_map[char] = letter_map.get(char, 0) + 1
-
+        # Answers sharing a feedback are exactly the candidates left after that feedback,
+        # so each group of size k contributes k remaining candidates for each of its k answers
+        guess_idx = WORD_INDEX.get(candidate)
+        if guess_idx is not None and self._answer_idxs is not None:
+            feedbacks = feedback_row(guess_idx)[self._answer_idxs]
+        else:
+            feedbacks = get_feedback_batch(candidate, candidates)
+        groups = np.bincount(feedbacks).astype(np.int64)
+        total_remaining = int((groups * groups).sum())
 
-        # Normalise letter frequencies
-        for char in letter_map:
-            letter_map[char] = letter_map[char] / num_candidates
+        # Letter frequencies of the remaining candidates, to reward candidates that use letters with lower frequencies
+        letter_map = self._letter_frequencies()
 
         # Penalise candidates that use letters with higher frequencies
-        for char in candidate:
-            score -= letter_map.get(char, 0) ** 2
-            score += sum(1 for char in candidate if letter_map.get(char, 0) == 1) ** 2 # Reward candidates that use 1-freq letters
+        score -= sum(letter_map.get(char, 0) ** 2 for char in candidate)
+
+        # Reward candidates that use 1-freq letters
+        score += sum(1 for char in candidate if letter_map.get(char, 0) == 1) ** 2
 
         average_remaining = total_remaining / num_candidates
         # Return negative average remaining to rank candidates that reduce more higher
         return -average_remaining * 100 + score
 
+    def score_all(self, words: list[str]) -> np.ndarray:
+        """
+        Scores many candidate words at once with the same measures as score.
+
+        The feedback of every word against every answer is taken as one matrix, from the shared table when
+        possible, and the partition sizes of all its rows are counted together.
+
+        Args:
+            words (list[str]): The candidate words to score, all of the candidates' length.
+
+        Returns:
+            np.ndarray: The score of each word, in order.
+        """
+
+        num_candidates = len(self.candidates)
+        if num_candidates == 0:
+            return np.zeros(len(words))
+
+        if self._answer_idxs is not None and all(word in WORD_INDEX for word in words):
+            feedbacks = feedback_block(np.array([WORD_INDEX[word] for word in words], dtype=np.intp), self._answer_idxs)
+        else:
+            feedbacks = feedback_matrix(encode_words(words), encode_words(self.candidates))
+        average_remaining = _partition_square_sums(feedbacks) / num_candidates
+
+        # Per-letter frequencies gathered at every position of every word, shape (length, len(words))
+        letter_frequencies = np.bincount(encode_words(self.candidates).ravel(), minlength=26) / num_candidates
+        frequencies = letter_frequencies[encode_words(words)]
+        ones = (frequencies == 1).sum(axis=0)
+
+        return -average_remaining * 100 + (ones ** 2 - (frequencies ** 2).sum(axis=0))
+
     def best(self, n: int = 1, show_progress: bool=False) -> list[str]:
         return _best_with_progress(self, n=n, show_progress=show_progress, description="Calculating Reduction scores...")
 
 class EntropyScorer:
 
     """
-    Optimized EntropyScorer that precomputes feedback cache using multiprocessing to speed up entropy calculations.
+    Optimized EntropyScorer that reads each guess's feedback against all candidates from the precomputed feedback table.
     Reduces redundant feedback computations and batches DB writes to improve performance.
     """
 
@@ -252,72 +427,28 @@ class EntropyScorer:
     STRICT_CANDIDATES = True
     FIRST_GUESS = "soare"
 
-    CANDIDATE_HASH_CACHE = {}
-
-    @staticmethod
-    def _compute_feedback_for_entropy(args):
-        candidate, answer = args
-        return (candidate, answer, get_feedback(candidate, answer))
-
     def __init__(self, candidates: list[str]):
 
         self.candidates = candidates
         self._entropy_cache = {}
-        self._db_lock = threading.Lock()
-
-        # Ensure feedback directory exists
-        feedback_dir = os.path.join(os.getcwd(), "feedback")
-        if not os.path.exists(feedback_dir):
-            os.makedirs(feedback_dir)
-
-        # Initialize persistent DB connection in feedback directory
-        db_path = os.path.join(feedback_dir, "feedback.db")
-        self._conn = sqlite3.connect(db_path, check_same_thread=False)
-        self._conn.execute("PRAGMA journal_mode=WAL;")  # Enable WAL for concurrency
-        self._conn.execute("PRAGMA synchronous=NORMAL;")
-        self._conn.execute("CREATE TABLE IF NOT EXISTS entropy (guess TEXT, answer TEXT, entropy REAL, candidate_set_hash TEXT, PRIMARY KEY (guess, answer, candidate_set_hash));")
-        self._conn.commit()
-
-        # Cache for feedback results to avoid redundant calculations
-        self._feedback_cache = {}
-
-        # Cache candidate set hash once per instance
-        candidate_set = ",".join(sorted(self.candidates))
-        self._candidate_set_hash = hashlib.sha256(candidate_set.encode()).hexdigest()
+        self._prefetched = False
+        self._pending_writes = []
 
-        # Precompute feedback cache using multiprocessing pool
-        self.precompute_feedback_cache()
+        # Shared DB connection in the feedback directory, and the lock every scorer uses it under
+        self._conn = open_database()
+        self._db_lock = DB_LOCK
 
-    def precompute_feedback_cache(self):
-        """
-        Precompute and cache feedback for all candidate-answer pairs using multiprocessing to speed up entropy calculations.
-        Optimized to reduce multiprocessing overhead by chunking tasks and minimizing pickling.
-        """
-
-        pairs = [(candidate, answer) for candidate in self.candidates for answer in self.candidates]
-
-        def chunked_map(func, data, chunk_size=1000):
-            results = []
-            try:
-                with multiprocessing.Pool() as pool:
-                    for i in range(0, len(data), chunk_size):
-                        chunk = data[i:i+chunk_size]
-                        results.extend(pool.map(func, chunk))
-            except Exception as e:
-                print(f"Exception in multiprocessing pool: {e}")
-                with self._db_lock:
-                    try:
-                        self._conn.commit()
-                        self._conn.close()
-                    except Exception as ex:
-                        print(f"Error during DB cleanup after multiprocessing exception: {ex}")
-                raise
-            return results
-
-        results = chunked_map(self._compute_feedback_for_entropy, pairs, chunk_size=5000)
+        # Columns of the answers in the shared feedback table, or None when an answer is not in WORDS,
+        # in which case each guess's feedback against the encoded answers is computed directly
+        if all(candidate in WORD_INDEX for candidate in self.candidates):
+            self._answer_idxs = np.array([WORD_INDEX[candidate] for candidate in self.candidates], dtype=np.intp)
+        else:
+            self._answer_idxs = None
+        self._answer_codes = encode_words(self.candidates)
 
-        for candidate, answer, feedback in results:
-            self._feedback_cache[(candidate, answer)] = feedback
+        # Cache candidate set hash and word ids once per instance
+        self._candidate_set_hash = hash_candidate_set(self.candidates)
+        self._word_ids = get_word_ids()
 
     def entropy(self, candidate: str) -> float:
         """
@@ -327,11 +458,11 @@ class EntropyScorer:
         Entropy is a measure of the expected information gain from guessing the candidate word.
         Higher entropy indicates a guess that is expected to reduce the candidate space more effectively.
 
-        This method uses a cached feedback map to avoid recalculating entropy for
-        candidates that have been scored before. If the entropy is not cached, it computes the
+        This method uses a cached entropy map, prefetched from 'feedback.db' on first use, to avoid
+        recalculating entropy for candidates that have been scored before. If the entropy is not cached, it computes the
         distribution of feedback patterns by comparing the candidate against all possible answers,
-        calculates the entropy from this distribution, and writes the updated entropy back to
-        'feedback.db' for future use.
+        calculates the entropy from this distribution, and stages the entropy to be written back to
+        'feedback.db' for future use when scoring finishes.
 
         Args:
             candidate (str): The candidate word to calculate entropy for.
@@ -340,89 +471,159 @@ class EntropyScorer:
             float: The calculated entropy value representing expected information gain.
         """
 
-        cache_key = (candidate, self._candidate_set_hash)
-        if cache_key in self._entropy_cache:
-            return self._entropy_cache[cache_key]
+        if not self._prefetched:
+            self.prefetch()
+
+        # The candidate set, and so its hash, is fixed per instance, so entropies are cached by candidate alone
+        if candidate in self._entropy_cache:
+            return self._entropy_cache[candidate]
+
+        # Feedback against every answer as one contiguous uint16 row, then the entropy of its partition sizes
+        guess_idx = WORD_INDEX.get(candidate)
+        if guess_idx is not None and self._answer_idxs is not None:
+            feedbacks = feedback_row(guess_idx)[self._answer_idxs]
+        else:
+            feedbacks = feedback_matrix(encode_words([candidate]), self._answer_codes)[0]
+        e = float(_partition_entropies(feedbacks[np.newaxis])[0])
+
+        # Stage the entropy row; rows are written to the DB together once scoring is done.
+        # Words outside WORDS have no id and are not stored.
+        word_id = self._word_ids.get(candidate)
+        if word_id is not None:
+            self._pending_writes.append((word_id, self._candidate_set_hash, e))
+
+        self._entropy_cache[candidate] = e
+
+        return e
+
+    def score_all(self, words: list[str]) -> np.ndarray:
+        """
+        Calculate the entropy of every word in words, scoring uncached words together in row blocks.
+
+        Uncached words from WORDS have their feedback rows gathered from the shared table and their
+        entropies computed in one vectorised pass; any other word falls back to entropy().
+
+        Args:
+            words (list[str]): The words to score.
+
+        Returns:
+            np.ndarray: The entropy of each word, in the order of words.
+        """
+
+        if not self._prefetched:
+            self.prefetch()
+
+        scores = np.empty(len(words))
+        positions, guess_idxs = [], []
+        for i, word in enumerate(words):
+            if word in self._entropy_cache:
+                scores[i] = self._entropy_cache[word]
+            elif self._answer_idxs is not None and word in WORD_INDEX:
+                positions.append(i)
+                guess_idxs.append(WORD_INDEX[word])
+            else:
+                scores[i] = self.entropy(word)
+
+        # Gather at most ENTROPY_BLOCK_CELLS feedbacks at a time
+        block_rows = max(1, ENTROPY_BLOCK_CELLS // max(1, len(self.candidates)))
+        for start in range(0, len(guess_idxs), block_rows):
+            block_idxs = np.array(guess_idxs[start:start + block_rows], dtype=np.intp)
+            entropies = _partition_entropies(feedback_block(block_idxs, self._answer_idxs))
+            for i, e in zip(positions[start:start + block_rows], entropies.tolist()):
+                word = words[i]
+                scores[i] = e
+                self._entropy_cache[word] = e
+                word_id = self._word_ids.get(word)
+                if word_id is not None:
+                    self._pending_writes.append((word_id, self._candidate_set_hash, e))
+
+        return scores
+
+    def prefetch(self):
+        """
+        Load every stored entropy for this candidate set into the entropy cache with a single query.
+        """
+        self._prefetched = True
 
         # Use DB connection with lock for thread safety
         with self._db_lock:
-            cursor = self._conn.cursor()
             try:
-                cursor.execute("SELECT entropy FROM entropy WHERE guess=? AND answer=? AND candidate_set_hash=?", (candidate, "", self._candidate_set_hash))
-                row = cursor.fetchone()
-                if row is not None and row[0] is not None:
-                    self._entropy_cache[cache_key] = row[0]
-                    cursor.close()
-                    return row[0]
+                rows = self._conn.execute("SELECT guess_id, entropy FROM entropy_scores WHERE candidate_set_hash=? AND entropy IS NOT NULL", (self._candidate_set_hash,)).fetchall()
             except Exception as e:
                 print(f"Error reading entropy from DB: {e}")
-                cursor.close()
-
-        patterns = defaultdict(int)
-
-        for answer in self.candidates:
-            feedback = self._feedback_cache.get((candidate, answer))
-            if feedback is None:
-                feedback = get_feedback(candidate, answer)
-                self._feedback_cache[(candidate, answer)] = feedback
-            patterns[feedback] += 1
+                return
 
-        e = sum(-(p / len(self.candidates)) * math.log2(p / len(self.candidates)) for p in patterns.values())
+        words_by_id = {word_id: word for word, word_id in self._word_ids.items()}
+        for guess_id, e in rows:
+            if guess_id in words_by_id:
+                self._entropy_cache[words_by_id[guess_id]] = e
 
-        # Batch insert/update entropy in DB without immediate commit
+    def _flush_pending_writes(self):
+        """
+        Write all staged entropy rows to the DB in a single transaction.
+        """
         with self._db_lock:
-            cursor = self._conn.cursor()
+            rows, self._pending_writes = self._pending_writes, []
+            if not rows:
+                return
             try:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO entropy (guess, answer, entropy, candidate_set_hash)
-                    VALUES (?, ?, ?, ?)
-                """, (candidate, "", e, self._candidate_set_hash))
+                with self._conn:
+                    self._conn.executemany("""
+                        INSERT OR REPLACE INTO entropy_scores (guess_id, candidate_set_hash, entropy)
+                        VALUES (?, ?, ?)
+                    """, rows)
             except Exception as ex:
                 print(f"Error writing entropy to DB: {ex}")
-            cursor.close()
-
-        self._entropy_cache[cache_key] = e
-
-        return e
 
     def best(self, n: int = 1, show_progress: bool=False) -> list[str]:
         try:
-            best = _best_with_progress(self, n=n, show_progress=show_progress, description="Calculating Entropy scores...", candidates=WORDS, func=self.entropy)
-            self._conn.commit()
+            if not self._prefetched:
+                self.prefetch()
+            if self._answer_idxs is not None and len(self._entropy_cache) < len(WORDS):
+                # Every word is scored, so fill the whole shared table in batches up front
+                precompute_feedback_table()
+            if not show_progress:
+                # Without a progress bar every word is scored in one vectorised pass
+                best = _best_with_progress(self, n=n, candidates=WORDS)
+            else:
+                best = _best_with_progress(self, n=n, show_progress=show_progress, description="Calculating Entropy scores...", candidates=WORDS, func=self.entropy)
+            self._flush_pending_writes()
             return best
         except Exception as e:
             print(f"Exception in best(): {e}")
             print("Terminated")
+            self._flush_pending_writes()
             with self._db_lock:
                 self._conn.commit()
-                self._conn.close()
             raise
 
     def _handle_termination(self, signum, frame):
-        print(f"Received termination signal ({signum}). Committing and closing DB.")
+        print(f"Received termination signal ({signum}). Committing DB.")
+        self._flush_pending_writes()
         with self._db_lock:
             try:
                 self._conn.commit()
-                self._conn.close()
             except Exception as e:
                 print(f"Error during DB cleanup on termination: {e}")
         print("Terminated")
 
     def __del__(self):
+        # The connection is shared, so it is committed but left open
         try:
-            self._conn.commit()
-            self._conn.close()
+            self._flush_pending_writes()
+            with self._db_lock:
+                self._conn.commit()
         except Exception:
             pass
     
 class OptimisedEntropyScorer:
     """
     Highly optimized entropy scorer with improved caching, reduced DB operations,
-    and better multiprocessing efficiency for calculating word entropy in word games.
+    and batched feedback lookups for calculating word entropy in word games.
     
     Features:
-    - Precomputed feedback cache with efficient multiprocessing
-    - LRU caching for frequently used entropy calculations
+    - Feedback read from the shared precomputed feedback table in one lookup per candidate
+    - Per-instance caching of computed entropies
     - Batched DB operations with WAL mode for concurrency
     - Reduced memory footprint with optimized data structures
     - Thread-safe operations with proper locking
@@ -433,241 +634,165 @@ class OptimisedEntropyScorer:
     STRICT_CANDIDATES = True
     FIRST_GUESS = "soare"
 
+    # Entropy rows staged before they are written to the DB in one executemany
+    ENTROPY_BATCH_SIZE = 10_000
+
     def __init__(self, candidates: List[str]):
         """Initialize with a list of candidate words."""
         self.candidates = sorted(candidates)  # Sorting for consistent hashing
-        self._feedback_cache = {}
-        self._db_lock = threading.Lock()
-        self._init_database()
+        self._pending_entropy = []
+        # Exact entropies by candidate; the candidate set is fixed per instance
+        self._entropy_cache = {}
+        self._prefetched = False
+        # Shared DB connection in the feedback directory, and the lock every scorer uses it under
+        self._conn = open_database()
+        self._db_lock = DB_LOCK
         self._candidate_set_hash = self._hash_candidate_set()
-        self._precompute_thread = threading.Thread(target=self._precompute_feedback_cache, daemon=True)
-        self._precompute_thread.start()
-
-        # Precompute letter frequency counts for quick_entropy_upper_bound optimization
-        self._letter_counts = Counter()
-        self._total_letters = 0
-        for word in self.candidates:
-            unique_letters = set(word)
-            self._letter_counts.update(unique_letters)
-            self._total_letters += len(unique_letters)
-
-    def _init_database(self):
-        """Initialize the SQLite database connection with optimized settings."""
-        feedback_dir = os.path.join(os.getcwd(), "feedback")
-        os.makedirs(feedback_dir, exist_ok=True)
-        
-        db_path = os.path.join(feedback_dir, "feedback.db")
-        self._conn = sqlite3.connect(db_path, check_same_thread=False)
-        self._conn.execute("PRAGMA journal_mode=WAL;")
-        self._conn.execute("PRAGMA synchronous=NORMAL;")
-        self._conn.execute("""
-            CREATE TABLE IF NOT EXISTS entropy (
-                guess TEXT,
-                answer TEXT,
-                entropy REAL,
-                candidate_set_hash TEXT,
-                PRIMARY KEY (guess, answer, candidate_set_hash)
-            );
-        """)
-        self._conn.commit()
-
-    def _hash_candidate_set(self) -> str:
+        self._word_ids = get_word_ids()
+
+        # Columns of the answers in the shared feedback table, or None when an answer is not in WORDS
+        if all(candidate in WORD_INDEX for candidate in self.candidates):
+            self._answer_idxs = np.array([WORD_INDEX[candidate] for candidate in self.candidates], dtype=np.intp)
+        else:
+            self._answer_idxs = None
+        self._answer_codes = encode_words(self.candidates)
+
+        # No guess can split the answers into more partitions than there are answers or feedback patterns,
+        # and entropy is highest when every partition is the same size
+        self._max_entropy = math.log2(min(len(self.candidates), 3 ** len(self.candidates[0]))) if self.candidates else 0.0
+
+    def _hash_candidate_set(self) -> int:
         """Generate a consistent hash for the current candidate set."""
-        candidate_str = ",".join(self.candidates)
-        return hashlib.sha256(candidate_str.encode()).hexdigest()
-
-    @staticmethod
-    def _compute_feedback_pair(args):
-        """Static method for multiprocessing feedback calculations."""
-        candidate, answer = args
-        return (candidate, answer, get_feedback(candidate, answer))
-
-    def _precompute_feedback_cache(self):
-        """Precompute feedback for all candidate pairs using efficient multiprocessing."""
-        # Use a generator expression instead of a full list to reduce startup time
-        def pair_generator():
-            for c in self.candidates:
-                for a in self.candidates:
-                    yield (c, a)
-        pairs = pair_generator()
-        
-        # Process in chunks to balance memory and CPU usage
-        chunk_size = 100
-        
-        try:
-            with multiprocessing.Pool() as pool:
-                results = pool.imap_unordered(
-                    self._compute_feedback_pair,
-                    pairs,
-                    chunksize=chunk_size
-                )
-                # Update the feedback cache incrementally to reduce memory usage
-                for candidate, answer, feedback in results:
-                    self._feedback_cache[(candidate, answer)] = feedback
-        except Exception as e:
-            print(f"Exception in multiprocessing pool: {e}")
-            with self._db_lock:
-                try:
-                    self._conn.commit()
-                    self._conn.close()
-                except Exception as ex:
-                    print(f"Error during DB cleanup after multiprocessing exception: {ex}")
-            raise
+        return hash_candidate_set(self.candidates)
 
-    @lru_cache(maxsize=5000)
-    def entropy(self, candidate: str, threshold: float = -1.0) -> float:
+    def _feedbacks(self, candidate: str) -> np.ndarray:
+        """Feedback of a candidate against every answer, in candidate order, from one batched lookup."""
+        guess_idx = WORD_INDEX.get(candidate)
+        if guess_idx is not None and self._answer_idxs is not None:
+            return feedback_row(guess_idx)[self._answer_idxs]
+        return feedback_matrix(encode_words([candidate]), self._answer_codes)[0]
+
+    def entropy(self, candidate: str) -> float:
         """
         Calculate the entropy of a candidate word with caching at multiple levels.
-        Supports early stopping if entropy cannot exceed the given threshold.
+
+        Entropies stored for this candidate set are prefetched from the database on first use, and
+        newly computed ones are staged and written back in batches.
         
         Args:
             candidate (str): The candidate word to calculate entropy for.
-            threshold (float): Early stopping threshold. If partial entropy plus max possible remaining entropy
-                               is less than or equal to this, stop calculation early.
         
         Returns:
-            float: The calculated entropy value or a value less than or equal to threshold if early stopped.
+            float: The calculated entropy value.
         """
-        
-        # Check database cache only if no threshold or threshold is very low (to avoid false positives)
-        if threshold < 0:
-            with self._db_lock:
-                cursor = self._conn.cursor()
-                try:
-                    cursor.execute("""
-                        SELECT entropy FROM entropy 
-                        WHERE guess=? AND answer=? AND candidate_set_hash=?
-                    """, (candidate, "", self._candidate_set_hash))
-                    if (row := cursor.fetchone()):
-                        return row[0]
-                except Exception as e:
-                    print(f"DB read error: {e}")
-                finally:
-                    cursor.close()
-
-        # Calculate entropy from feedback patterns with early stopping
-        total = len(self.candidates)
-        entropy = 0.0
-        total_answers = 0
 
-        pattern_counts = defaultdict(int)
-        pattern_probs = {}
-        entropy_contribs = {}
+        if not self._prefetched:
+            self.prefetch()
 
-        for answer in self.candidates:
-            with threading.Lock():
-                feedback = self._feedback_cache.get((candidate, answer))
-            if feedback is None:
-                feedback = get_feedback(candidate, answer)
-                with threading.Lock():
-                    self._feedback_cache[(candidate, answer)] = feedback
-
-            old_count = pattern_counts[feedback]
-            new_count = old_count + 1
-            pattern_counts[feedback] = new_count
-            total_answers += 1
-
-            # Update probabilities and entropy contributions incrementally
-            old_prob = pattern_probs.get(feedback, 0)
-            new_prob = new_count / total_answers
-            pattern_probs[feedback] = new_prob
-
-            # Calculate new entropy contribution for this pattern
-            new_entropy_contrib = -new_prob * math.log2(new_prob) if new_prob > 0 else 0
-
-            # Calculate old entropy contribution for this pattern
-            old_entropy_contrib = entropy_contribs.get(feedback, 0)
-
-            # Update entropy by removing old contribution and adding new contribution
-            entropy += new_entropy_contrib - old_entropy_contrib
-
-            # Store new entropy contribution
-            entropy_contribs[feedback] = new_entropy_contrib
-
-            # Adjust other pattern probabilities due to total_answers change
-            for pattern, count in pattern_counts.items():
-                if pattern != feedback:
-                    old_p = pattern_probs.get(pattern, 0)
-                    new_p = count / total_answers
-                    if old_p != new_p:
-                        old_ec = entropy_contribs.get(pattern, 0)
-                        new_ec = -new_p * math.log2(new_p) if new_p > 0 else 0
-                        entropy += new_ec - old_ec
-                        pattern_probs[pattern] = new_p
-                        entropy_contribs[pattern] = new_ec
-
-            # Early stopping check: if entropy so far plus max possible remaining entropy < threshold, stop
-            max_possible_entropy = math.log2(total)  # Max entropy if all patterns equally likely
-            if threshold >= 0 and entropy + (max_possible_entropy * (total - total_answers) / total) <= threshold:
-                # Return a value less than or equal to threshold to indicate early stop
-                return threshold - 0.0001
-
-        # Cache result in database if no threshold or threshold < 0
-        if threshold < 0:
-            with self._db_lock:
-                cursor = self._conn.cursor()
-                try:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO entropy 
-                        (guess, answer, entropy, candidate_set_hash)
-                        VALUES (?, ?, ?, ?)
-                    """, (candidate, "", entropy, self._candidate_set_hash))
-                    self._conn.commit()
-                except Exception as e:
-                    print(f"DB write error: {e}")
-                finally:
-                    cursor.close()
+        if candidate in self._entropy_cache:
+            return self._entropy_cache[candidate]
+
+        # Entropy depends only on the final size of each feedback partition, so it is computed in one pass
+        # over the counts rather than renormalised after every answer
+        entropy = float(_partition_entropies(self._feedbacks(candidate)[np.newaxis])[0])
 
+        # Stage result for the database; words outside WORDS have no id and are not stored
+        word_id = self._word_ids.get(candidate)
+        if word_id is not None:
+            self._pending_entropy.append((word_id, self._candidate_set_hash, entropy))
+            if len(self._pending_entropy) >= self.ENTROPY_BATCH_SIZE:
+                self._flush_entropy()
+
+        self._entropy_cache[candidate] = entropy
         return entropy
 
+    def prefetch(self):
+        """Load every stored entropy for this candidate set into the entropy cache with a single query."""
+        self._prefetched = True
+
+        with self._db_lock:
+            try:
+                rows = self._conn.execute("""
+                    SELECT guess_id, entropy FROM entropy_scores
+                    WHERE candidate_set_hash=? AND entropy IS NOT NULL
+                """, (self._candidate_set_hash,)).fetchall()
+            except Exception as e:
+                print(f"DB read error: {e}")
+                return
+
+        words_by_id = {word_id: word for word, word_id in self._word_ids.items()}
+        for guess_id, e in rows:
+            if guess_id in words_by_id:
+                self._entropy_cache[words_by_id[guess_id]] = e
+
+    def _flush_entropy(self):
+        """Write all staged entropy rows to the DB in a single transaction."""
+        with self._db_lock:
+            rows, self._pending_entropy = self._pending_entropy, []
+            if not rows:
+                return
+            cursor = self._conn.cursor()
+            try:
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO entropy_scores 
+                    (guess_id, candidate_set_hash, entropy)
+                    VALUES (?, ?, ?)
+                """, rows)
+                self._conn.commit()
+            except Exception as e:
+                print(f"DB write error: {e}")
+            finally:
+                cursor.close()
+
     def quick_entropy_upper_bound(self, candidate: str) -> float:
         """
-        Quick heuristic to estimate an upper bound on entropy for a candidate.
-        Uses distribution of letter frequencies in candidate set to estimate max entropy.
-        """
-        # Use precomputed letter frequency counts
-        freqs = []
-        unique_letters = set(candidate)
-        for letter in unique_letters:
-            freq = self._letter_counts.get(letter, 0) / self._total_letters if self._total_letters > 0 else 0
-            freqs.append(freq)
-
-        # Estimate entropy upper bound as sum of -p*log2(p) for letter frequencies
-        entropy_bound = 0.0
-        for p in freqs:
-            if p > 0:
-                entropy_bound -= p * math.log2(p)
+        Admissible upper bound on the entropy of any candidate against the current answers.
 
-        # Scale by number of unique letters to approximate entropy
-        entropy_bound *= len(unique_letters)
-        return entropy_bound
+        The bound never underestimates, so best() only skips candidates that cannot enter the top n found so far.
+        """
+        return self._max_entropy
 
     def best(self, n: int = 1, show_progress: bool = False) -> list[str]:
         """
         Find the top n candidates with highest entropy using early elimination optimization.
         
         Args:
-            n: Number of top candidates to return
+            n: Number of top candidates to return, or -1 for all scored candidates
             show_progress: Whether to display progress information
             
         Returns:
-            List of top candidates or single string if n=1
+            List of top candidates, best first
         """
-        best_entropy = -1.0
         candidates_scores = []
+        # Min-heap of the n best entropies so far; a word is skipped only if its bound cannot beat the smallest.
+        # Ties go to earlier words, so a later word that can only tie it cannot enter the top n either.
+        kept = []
+
+        def prune(candidate: str) -> bool:
+            return 0 < n == len(kept) and self.quick_entropy_upper_bound(candidate) <= kept[0]
+
+        def keep(score: float) -> None:
+            if n <= 0:
+                return
+            if len(kept) < n:
+                heapq.heappush(kept, score)
+            elif score > kept[0]:
+                heapq.heapreplace(kept, score)
 
         if len(self.candidates) == 1:
             return self.candidates
 
+        if self._answer_idxs is not None:
+            # Every word is scored, so fill the whole shared table in batches up front
+            precompute_feedback_table()
+
         if not show_progress:
             for candidate in WORDS:
-                upper_bound = self.quick_entropy_upper_bound(candidate)
-                if upper_bound <= best_entropy:
+                if prune(candidate):
                     # Skip full entropy calculation if upper bound is not better
                     continue
-                score = self.entropy(candidate, threshold=best_entropy)
-                if score > best_entropy:
-                    best_entropy = score
+                score = self.entropy(candidate)
+                keep(score)
                 candidates_scores.append((candidate, score))
         
         else:
@@ -683,38 +808,28 @@ class OptimisedEntropyScorer:
                 
                 task = progress.add_task("[green]Calculating Entropy scores...", total=len(WORDS), current_word="")
                 for candidate in WORDS:
-                    upper_bound = self.quick_entropy_upper_bound(candidate)
-                    if upper_bound <= best_entropy:
+                    if prune(candidate):
                         # Skip full entropy calculation if upper bound is not better
                         progress.update(task, advance=1, current_word=f"[bright_blue]{candidate} (skipped)")
                         continue
-                    score = self.entropy(candidate, threshold=best_entropy)
-                    if score > best_entropy:
-                        best_entropy = score
+                    score = self.entropy(candidate)
+                    keep(score)
                     candidates_scores.append((candidate, score))
                     progress.update(task, advance=1, current_word=f"[bright_blue]{candidate}")
 
         # Ensure DB changes are committed asynchronously
         self._async_commit()
 
-        # Get top n candidates by score
-        candidates_scores.sort(key=lambda x: x[1], reverse=True)
-        if n == 1:
-            return candidates_scores[0][0]
-        else:
-            return [candidate for candidate, score in candidates_scores[:n]]
+        # Get top n candidates by score; a negative n keeps them all
+        if n < 0:
+            n = len(candidates_scores)
+        words = [candidate for candidate, score in candidates_scores]
+        return _top_n(np.array([score for candidate, score in candidates_scores]), n, words)
   
     def _async_commit(self):
-        """Commit the database in a separate thread."""
-
-        def commit_thread_func():
-            with self._db_lock:
-                try:
-                    self._conn.commit()
-                except Exception as e:
-                    print(f"DB async commit error: {e}")
+        """Write staged entropy rows to the database in a separate thread."""
 
-        thread = threading.Thread(target=commit_thread_func)
+        thread = threading.Thread(target=self._flush_entropy)
         thread.daemon = True
         thread.start()
 
@@ -728,13 +843,13 @@ class OptimisedEntropyScorer:
 
     def close(self):
         """Explicit cleanup method for resource management."""
+        self._flush_entropy()
+        # The connection is shared, so it is committed but left open
         with self._db_lock:
             print("Committing DB connection...")
             self._conn.commit()
-            self._conn.close()
         # Clear caches
-        self.entropy.cache_clear()
-        self._feedback_cache.clear()
+        self._entropy_cache.clear()
 
     def __del__(self):
         """Destructor for fallback cleanup."""
@@ -766,10 +881,6 @@ class SimpleEntropyScorer:
         Returns:
             float: The calculated entropy value representing expected information gain.
         """
-        from collections import defaultdict
-        import math
-        from utils import get_feedback
-
         patterns = defaultdict(int)
         total = len(self.candidates)
 
@@ -801,11 +912,31 @@ class FastEntropyScorer:
     def __init__(self, candidates: list[str]):
         self.candidates = candidates
 
+        # Columns of the answers in the shared feedback table, or None when an answer is not in WORDS
+        if all(candidate in WORD_INDEX for candidate in self.candidates):
+            self._answer_idxs = np.array([WORD_INDEX[candidate] for candidate in self.candidates], dtype=np.intp)
+        else:
+            self._answer_idxs = None
+
+    def score_all(self, words: list[str]) -> np.ndarray:
+        """
+        Calculate the entropy of every word in words against the candidates in one vectorised pass.
+
+        Args:
+            words (list[str]): The words to score.
+
+        Returns:
+            np.ndarray: The entropy of each word, in the order of words.
+        """
+
+        if self._answer_idxs is not None and all(word in WORD_INDEX for word in words):
+            feedbacks = feedback_block(np.array([WORD_INDEX[word] for word in words], dtype=np.intp), self._answer_idxs)
+        else:
+            feedbacks = feedback_matrix(encode_words(words), encode_words(self.candidates))
+        return _partition_entropies(feedbacks)
+
     def best(self, n: int = 1, show_progress: bool=False) -> list[str]:
-        es = OptimisedEntropyScorer(self.candidates)
-        best = _best_with_progress(self, n=n, show_progress=show_progress, description="Calculating Fast Entropy scores...", func=es.entropy)
-        es._conn.commit()
-        return best
+        return _best_with_progress(self, n=n, show_progress=show_progress, description="Calculating Fast Entropy scores...")
 
 class HybridScorer:
 
@@ -818,19 +949,26 @@ class HybridScorer:
     STRICT_CANDIDATES = False
     FIRST_GUESS = "tares"
 
+    # Candidate sets smaller than this are scored by ReductionScorer
+    REDUCTION_THRESHOLD = 250
+
     def __init__(self, candidates: list[str]):
         self.candidates = candidates
+        # The candidate set is fixed, so the strategy is picked and built once for every score() call
+        if len(candidates) < self.REDUCTION_THRESHOLD:
+            self._inner, self._weight = ReductionScorer(candidates), 1500
+        else:
+            self._inner, self._weight = IntuitiveScorer(candidates), 1
 
     def score(self, candidate: str) -> float:
 
-        if len(self.candidates) < 250:
-            return ReductionScorer(self.candidates).score(candidate) * 1500# + IntuitiveScorer:(self.candidates).score(candidate) * 0.01
-        return IntuitiveScorer(self.candidates).score(candidate)
+        return self._inner.score(candidate) * self._weight# + IntuitiveScorer(self.candidates).score(candidate) * 0.01
 
     def best(self, n: int = 1, show_progress: bool=False) -> list[str]:
-        return _best_with_progress(self, n=n, show_progress=show_progress, description="Calculating Hybrid scores...")
+        # Scaling by a positive weight keeps the ranking, so the chosen scorer ranks the candidates itself
+        return self._inner.best(n=n, show_progress=show_progress)
 
-class StrictHybridScorer:
+class StrictHybridScorer(HybridScorer):
 
     """
     Similar to HybridScorer but enforces strict candidate filtering.
@@ -841,14 +979,4 @@ class StrictHybridScorer:
     STRICT_CANDIDATES = True
     FIRST_GUESS = "tares"
 
-    def __init__(self, candidates: list[str]):
-        self.candidates = candidates
-
-    def score(self, candidate: str) -> float:
-
-        if len(self.candidates) < 100:
-            return ReductionScorer(self.candidates).score(candidate) * 1500# + IntuitiveScorer:(self.candidates).score(candidate) * 0.01
-        return IntuitiveScorer(self.candidates).score(candidate)
-
-    def best(self, n: int = 1, show_progress: bool=False) -> list[str]:
-        return _best_with_progress(self, n=n, show_progress=show_progress, description="Calculating Strict Hybrid scores...")
+    REDUCTION_THRESHOLD = 100
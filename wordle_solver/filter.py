@@ -1,12 +1,31 @@
 from typing import Optional
+
+import numpy as np
+
 from wordle_solver import candidate_scorers as cs
 
-from utils import get_feedback
+from utils import feedback_row, get_feedback, lane_equal, pack_words, LANE_LOW_BITS, WORD_INDEX, WORDS, WORDS_PACKED
 
 SCORER = cs.HybridScorer
 IMPOSSIBLE_PROPORTION_KEPT = 0.4
 IMPOSSIBLE_REGARD_RANGE = range(0, 40)
 
+def _letter_pattern(ch: str) -> int:
+    """
+    Returns a packed word made of a single letter repeated in every lane.
+    """
+    return (ord(ch) - ord("a")) * LANE_LOW_BITS
+
+def _letter_count(packed: np.ndarray, ch: str, length: int) -> np.ndarray:
+    """
+    Counts the occurrences of a letter in each packed word.
+    """
+    matches = lane_equal(packed, _letter_pattern(ch))
+    counts = np.zeros(len(packed), dtype=np.uint8)
+    for lane in range(length):
+        counts += ((matches >> (5 * lane)) & 1).astype(np.uint8)
+    return counts
+
 class Filter:
 
     def __init__(self, greens: Optional[dict[str, set[int]]] = None, yellows: Optional[dict[str, set[int]]] = None, greys: Optional[set[str]] = None, length: int = 5):
@@ -29,6 +48,13 @@ class Filter:
         self.min_counts = {}  # letter -> minimum count
         self.max_counts = {}  # letter -> maximum count
 
+        # Positions where each letter was guessed and came back grey, so the answer cannot hold it there
+        self.grey_positions = {}  # letter -> set of positions
+
+        # Mask over WORDS of words consistent with every update so far.
+        # Only tracked for filters built purely from updates, since seeded colour maps carry no guess history.
+        self.alive = np.ones(len(WORDS), dtype=bool) if not (greens or yellows or greys) else None
+
     def __str__(self) -> str:
         return f"""
         Greens: {self.greens}
@@ -141,53 +167,49 @@ class Filter:
         - Excluding words containing any grey letters.
         - Ensuring green letters are in the correct positions.
         - Ensuring yellow letters are present but not in forbidden positions.
+        - Excluding letters from the positions where they came back grey.
         - Enforcing min_counts and max_counts for letters.
+
+        Checks run over the whole word list at once on words packed 5 bits per letter.
+        When filtering WORDS itself, the incrementally maintained alive mask is used instead of rescanning.
         """
-        filtered = []
-        for word in words:
-            # Exclude words containing any grey letters
-            if any(ch in self.greys for ch in word):
-                continue
-
-            # Check green letters: must be in correct positions
-            green_valid = True
-            for ch, positions in self.greens.items():
-                if any(pos >= len(word) or word[pos] != ch for pos in positions):
-                    green_valid = False
-                    break
-            if not green_valid:
-                continue
-
-            # Check yellow letters: must be present but not in forbidden positions
-            yellow_valid = True
-            for ch, forbidden_positions in self.yellows.items():
-                # Word must contain at least min_counts[ch] occurrences of ch
-                if word.count(ch) < self.min_counts.get(ch, 0):
-                    yellow_valid = False
-                    break
-                # Letter must not be in any forbidden positions
-                if any(pos < len(word) and word[pos] == ch for pos in forbidden_positions):
-                    yellow_valid = False
-                    break
-            if not yellow_valid:
-                continue
-
-            # Count letters in word
-            letter_counts = {}
-            for ch in word:
-                letter_counts[ch] = letter_counts.get(ch, 0) + 1
-
-            # Enforce min_counts
-            if any(letter_counts.get(ch, 0) < min_ct for ch, min_ct in self.min_counts.items()):
-                continue
-
-            # Enforce max_counts
-            if any(letter_counts.get(ch, 0) > max_ct for ch, max_ct in self.max_counts.items()):
-                continue
-
-            filtered.append(word)
-
-        return filtered
+        if self.alive is not None and words is WORDS:
+            return [WORDS[i] for i in np.flatnonzero(self.alive)]
+
+        # WORDS is packed once at import; any other list is packed here
+        packed = WORDS_PACKED if words is WORDS else pack_words(words)
+        keep = np.ones(len(words), dtype=bool)
+
+        # Exclude words containing any grey letters
+        for ch in self.greys:
+            keep &= lane_equal(packed, _letter_pattern(ch)) == 0
+
+        # Check green letters: every green lane must hold its letter
+        green_mask = green_value = 0
+        for ch, positions in self.greens.items():
+            for pos in positions:
+                green_mask |= 0b11111 << (5 * pos)
+                green_value |= (ord(ch) - ord("a")) << (5 * pos)
+        if green_mask:
+            keep &= (packed & green_mask) == green_value
+
+        # Check yellow letters: letter must not be in any forbidden positions
+        for ch, forbidden_positions in self.yellows.items():
+            forbidden_lanes = sum(1 << (5 * pos) for pos in forbidden_positions)
+            keep &= (lane_equal(packed, _letter_pattern(ch)) & forbidden_lanes) == 0
+
+        # Check grey positions: a grey guess letter is never the answer's letter at that position
+        for ch, grey_positions in self.grey_positions.items():
+            grey_lanes = sum(1 << (5 * pos) for pos in grey_positions)
+            keep &= (lane_equal(packed, _letter_pattern(ch)) & grey_lanes) == 0
+
+        # Enforce min_counts and max_counts (yellow presence is covered by min_counts)
+        for ch in self.min_counts.keys() | self.max_counts.keys():
+            counts = _letter_count(packed, ch, self.length)
+            keep &= counts >= self.min_counts.get(ch, 0)
+            keep &= counts <= self.max_counts.get(ch, self.length)
+
+        return [words[i] for i in np.flatnonzero(keep)]
 
     def update(self, guess: str, feedback: int) -> None:
         """
@@ -202,9 +224,19 @@ class Filter:
             - self.greens: dict of letter to set of positions confirmed green.
             - self.yellows: dict of letter to set of positions forbidden (yellow positions).
             - self.greys: set of letters confirmed absent.
+            - self.grey_positions: dict of letter to set of positions where it was grey.
             - self.min_counts: minimum count of each letter.
             - self.max_counts: maximum count of each letter.
+            - self.alive: mask of WORDS that would have produced the same feedback.
         """
+        if self.alive is not None:
+            guess_idx = WORD_INDEX.get(guess)
+            if guess_idx is None:
+                # Guesses outside WORDS have no feedback row; fall back to scanning
+                self.alive = None
+            else:
+                self.alive &= feedback_row(guess_idx) == feedback
+
         def get_feedback_color(pos: int) -> int:
             return (feedback >> (2 * pos)) & 0b11
 
@@ -228,6 +260,7 @@ class Filter:
                 yellow_counts[ch] = yellow_counts.get(ch, 0) + 1
             else:  # grey
                 grey_counts[ch] = grey_counts.get(ch, 0) + 1
+                self.grey_positions.setdefault(ch, set()).add(i)
 
         # Update greens: add positions
         for ch, positions in green_positions.items():
@@ -2,7 +2,7 @@ from typing import Literal
 
 import wordle_solver.candidate_scorers as cs
 from wordle_solver.filter import Filter
-from utils import args, WORDS, format_candidates, intify_feedback
+from utils import args, WORDS, WORDS_SET, format_candidates, intify_feedback
 
 
 def receive_word() -> str | Literal[False]:
@@ -29,7 +29,7 @@ def receive_word() -> str | Literal[False]:
         if len(word) != args.length:
             print("Please enter a word of the correct length.")
             continue
-        if word not in WORDS:
+        if word not in WORDS_SET:
             print("Please enter a valid word. (Not in word list)")
             continue
         break
@@ -1,7 +1,7 @@
 import random as rnd
 
 from wordle_solver.filter import Filter
-from utils import WORDS, args, get_feedback, format_feedback
+from utils import WORDS, WORDS_SET, args, get_feedback, format_feedback
 
 def validate_guess(guess: str, filter: Filter) -> bool:
     if not guess.isalpha():
@@ -10,7 +10,7 @@ def validate_guess(guess: str, filter: Filter) -> bool:
     if len(guess) != filter.length:
         print("Please enter a word of the correct length.")
         return False
-    if guess not in WORDS:
+    if guess not in WORDS_SET:
         print("Please enter a valid word.")
         return False
     return True
@@ -19,7 +19,7 @@ def get_user_guess() -> str:
     return input("Guess a word:\t")
 
 def play() -> None:
-    answer = rnd.choice(list(WORDS))
+    answer = rnd.choice(WORDS)
     filter = Filter(length=args.length)
 
     while True: